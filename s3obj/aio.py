@@ -0,0 +1,100 @@
+import asyncio
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import aioboto3
+from botocore.config import Config as Boto3Config
+from loguru import logger
+
+
+class AsyncS3Boto3:
+    """
+    An asyncio wrapper around the aioboto3 s3 client, to be used as an async context manager
+
+        async with AsyncS3Boto3() as s3:
+            await s3.download_many(items)
+    """
+
+    def __init__(
+            self,
+            endpoint_url: str = None,
+            config: Optional[Boto3Config] = None,
+            max_pool_connections: int = 128,
+    ):
+        """
+
+        Args:
+            endpoint_url: s3 endpoint url
+            config: botocore config used for the client. If None a default with adaptive retries
+                and a connection pool of max_pool_connections is used
+            max_pool_connections: size of the http connection pool. Ignored if config is given
+        """
+        self.endpoint_url = endpoint_url
+        self.config = config or Boto3Config(
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            max_pool_connections=max_pool_connections,
+        )
+        self._session = aioboto3.Session()
+        self._client_context = None
+        self.s3_client = None
+
+    async def __aenter__(self):
+        self._client_context = self._session.client(
+            "s3", endpoint_url=self.endpoint_url, config=self.config
+        )
+        self.s3_client = await self._client_context.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._client_context.__aexit__(exc_type, exc_val, exc_tb)
+        self._client_context = None
+        self.s3_client = None
+
+    async def download_file(
+            self, bucket: str, prefix: str, target: str, overwrite: bool = False
+    ):
+        """
+        Download file from s3
+        Args:
+            bucket:
+            prefix:
+            target: target path
+            overwrite:
+
+        Returns:
+
+        """
+
+        target = Path(target)
+        if target.exists() and not overwrite:
+            logger.info(f"[already exists] {target}, skipping download.")
+            return
+        if not target.parent.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"[Downloading] s3://{bucket}/{prefix} -> {target}")
+        await self.s3_client.download_file(bucket, prefix, str(target))
+
+    async def download_many(
+            self,
+            items: Iterable[Tuple[str, str, str]],
+            concurrency: int = 128,
+            overwrite: bool = False,
+    ):
+        """
+        Download many files from s3 concurrently on the event loop
+        Args:
+            items: iterable of (bucket, prefix, target) tuples
+            concurrency: maximum number of downloads in flight
+            overwrite:
+
+        Returns: None
+
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _download(item):
+            async with semaphore:
+                await self.download_file(*item, overwrite=overwrite)
+
+        await asyncio.gather(*(_download(item) for item in items))
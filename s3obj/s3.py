@@ -1,14 +1,79 @@
+import functools
+import inspect
+import multiprocessing
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPSConnection
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 import boto3
+import urllib3.connection
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 import os
 
 from loguru import logger
 from botocore.config import Config as Boto3Config
 
-from s3obj.utils import get_extension
+from s3obj.utils import _fast_ext
+
+MB = 1024 * 1024
+
+# minimum number of keys in one directory for exists_many to list it instead of using head_object
+_EXISTS_MANY_MIN_GROUP = 4
+
+# minimum number of objects in one local directory for exists_local_many to scan it
+_EXISTS_LOCAL_MANY_MIN_GROUP = 16
+
+# keys per list_objects_v2 page
+_LIST_PAGE_SIZE = 1000
+
+# default number of threads of the batch methods (download_many, upload_many, copy_many)
+DEFAULT_MAX_WORKERS = 32
+
+_HEADER_KEEP = frozenset({"LastModified", "ContentLength", "ETag", "VersionId", "ContentType", "Metadata"})
+
+
+def _set_default_blocksize(cls, blocksize: int):
+    """
+    Change the default of the blocksize argument of cls.__init__, whether it is
+    positional (http.client.HTTPConnection) or keyword only (HTTPSConnection, urllib3>=2)
+    """
+    init = cls.__init__
+    if init.__kwdefaults__ and "blocksize" in init.__kwdefaults__:
+        init.__kwdefaults__["blocksize"] = blocksize
+        return
+    positional = [
+        p.name for p in inspect.signature(init).parameters.values()
+        if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    ]
+    if "blocksize" in positional and init.__defaults__:
+        defaults = list(init.__defaults__)
+        defaults[positional.index("blocksize") - len(positional)] = blocksize
+        init.__defaults__ = tuple(defaults)
+
+
+if os.environ.get("S3OBJ_BIG_HTTP_BUFFER") == "1":
+    # bodies are sent in 8KB (http.client) or 16KB (urllib3>=2) blocks which caps single
+    # stream throughput; 1MB blocks mean far fewer send calls at the cost of more memory per
+    # connection. urllib3<2 defers to http.client, urllib3>=2 passes its own default explicitly
+    for _cls in (HTTPConnection, HTTPSConnection, urllib3.connection.HTTPConnection,
+                 urllib3.connection.HTTPSConnection):
+        _set_default_blocksize(_cls, MB)
+
+
+def _header_from_list_entry(list_obj: dict) -> dict:
+    """
+    Build a header from an entry of a list_objects_v2 response
+    """
+    return {
+        "ContentLength": list_obj["Size"],
+        "LastModified": list_obj["LastModified"],
+        "ETag": list_obj["ETag"],
+    }
 
 
 class S3Boto3:
@@ -19,36 +84,279 @@ class S3Boto3:
     def __init__(
             self,
             endpoint_url: str = None,
-            config: Boto3Config = Boto3Config(
-                retries={"max_attempts": 10, "mode": "adaptive"}
-            ),
+            config: Optional[Boto3Config] = None,
+            multipart_threshold: int = 8 * MB,
+            multipart_chunksize: int = 8 * MB,
+            max_concurrency: int = 10,
+            max_pool_connections: Optional[int] = None,
+            io_chunksize: int = MB,
+            header_cache_size: int = 4096,
+            session: Optional[boto3.session.Session] = None,
     ):
-        self.s3_resource = boto3.resource(
-            "s3", endpoint_url=endpoint_url, config=config
+        """
+
+        Args:
+            endpoint_url: s3 endpoint url
+            config: botocore config used for the client. If None a default with adaptive retries,
+                tcp keepalive and a connection pool sized by max_pool_connections is used
+            multipart_threshold: size in bytes above which transfers are split into parts
+            multipart_chunksize: size in bytes of each part of a multipart transfer
+            max_concurrency: number of threads used to transfer parts in parallel
+            max_pool_connections: size of the http connection pool. Defaults to
+                DEFAULT_MAX_WORKERS + max_concurrency, enough for the batch methods with their default
+                max_workers. When calling download/upload from several threads this should be at least
+                the number of threads plus max_concurrency, otherwise connections are discarded
+                and re-established on every request. Ignored if config is given
+            io_chunksize: size in bytes of the reads from the http response body of downloads.
+                It has no effect on uploads
+            header_cache_size: maximum number of headers kept for read side lookups
+            session: boto3 session to create the client from. If None boto3's default session is
+                used, which honours boto3.setup_default_session. Worker processes of the batch
+                methods can't receive a session and always use their default session
+        """
+        if config is None:
+            if max_pool_connections is None:
+                max_pool_connections = DEFAULT_MAX_WORKERS + max_concurrency
+            config = Boto3Config(
+                retries={"max_attempts": 10, "mode": "adaptive"},
+                max_pool_connections=max_pool_connections,
+                tcp_keepalive=True,
+            )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            io_chunksize=io_chunksize,
+            use_threads=True,
         )
-        self.s3_client = boto3.client("s3", endpoint_url=endpoint_url, config=config)
+        if session is None:
+            self.s3_client = boto3.client("s3", endpoint_url=endpoint_url, config=config)
+        else:
+            self.s3_client = session.client("s3", endpoint_url=endpoint_url, config=config)
+        # settings to rebuild an equivalent client in worker processes
+        self._init_kwargs = dict(
+            endpoint_url=endpoint_url,
+            config=config,
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            io_chunksize=io_chunksize,
+            header_cache_size=header_cache_size,
+        )
+        self._process_settings = None
+        self._max_pool_connections = config.max_pool_connections or 10
+        # LRU of headers keyed by (bucket, prefix); only found objects are cached
+        self._header_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        self._header_cache_size = header_cache_size
+        self._header_cache_lock = threading.Lock()
+
+    def _cache_header(self, bucket: str, prefix: str, header: dict):
+        with self._header_cache_lock:
+            self._header_cache[(bucket, prefix)] = header
+            self._header_cache.move_to_end((bucket, prefix))
+            while len(self._header_cache) > self._header_cache_size:
+                self._header_cache.popitem(last=False)
+
+    def _evict_header(self, bucket: str, prefix: str):
+        with self._header_cache_lock:
+            self._header_cache.pop((bucket, prefix), None)
+
+    def prefetch_headers(self, bucket: str, parent_prefix: str) -> int:
+        """
+        List a parent prefix once and cache the headers of all objects under it, so
+        read side lookups of those objects don't need a head_object request each.
+        At most header_cache_size headers are kept
+        Args:
+            bucket:
+            parent_prefix: directory-like prefix to list
+
+        Returns: number of objects listed
+
+        """
+        count = 0
+        for entry in self.iter_keys(bucket, self._normalize_list_prefix(parent_prefix), with_metadata=True):
+            self._cache_header(bucket, entry["Key"], _header_from_list_entry(entry))
+            count += 1
+        return count
 
-    def get_header(self, bucket: str, prefix: str):
+    def clear_header_cache(self) -> None:
+        """
+        Drop all cached headers
+        """
+        with self._header_cache_lock:
+            self._header_cache.clear()
+
+    def get_header(self, bucket: str, prefix: str, use_cache: bool = False):
+        """
+        Get the metadata of an object
+        Args:
+            bucket:
+            prefix:
+            use_cache: return a previously fetched header if there is one. Only use this
+                for read side checks, the object may have changed since
+
+        Returns: dict of the kept head_object fields
+
+        """
+        if use_cache:
+            with self._header_cache_lock:
+                header = self._header_cache.get((bucket, prefix))
+                if header is not None:
+                    self._header_cache.move_to_end((bucket, prefix))
+                    return header
         header = self.s3_client.head_object(Bucket=bucket, Key=prefix)
-        return {k: v for k, v in header.items() if
-                k in {"LastModified", "ContentLength", "ETag", "VersionId", "ContentType", "Metadata"}}
+        header = {k: header[k] for k in _HEADER_KEEP if k in header}
+        if use_cache:
+            self._cache_header(bucket, prefix, header)
+        return header
 
-    def check_exists(self, bucket: str, prefix: str):
+    def check_exists(self, bucket: str, prefix: str, use_cache: bool = True):
         """
         Check if object exists in s3
         Args:
             bucket:
             prefix:
+            use_cache: trust a previously fetched header. Pass False before writes
 
         Returns:
 
         """
         try:
-            self.get_header(bucket, prefix)
+            self.get_header(bucket, prefix, use_cache=use_cache)
             return True
         except ClientError:
             return False
 
+    @staticmethod
+    def _normalize_list_prefix(prefix: str) -> str:
+        """
+        Append a "/" to directory-like prefixes. Listing "a/b/" is much faster than "a/b"
+        which also has to match keys such as "a/bc"
+        Args:
+            prefix:
+
+        Returns: normalized prefix
+
+        """
+        if not prefix or prefix.endswith("/") or _fast_ext(prefix):
+            return prefix
+        return f"{prefix}/"
+
+    def list_objects(self, bucket: str, prefix: str, recursive: bool = True) -> List[dict]:
+        """
+        List the objects under a prefix
+        Args:
+            bucket:
+            prefix: a directory-like prefix, a trailing "/" is added if missing
+            recursive: if False only the objects directly under prefix are listed
+
+        Returns: list of list_objects_v2 "Contents" entries
+
+        """
+        return list(self.iter_keys(
+            bucket,
+            self._normalize_list_prefix(prefix),
+            delimiter=None if recursive else "/",
+            with_metadata=True,
+        ))
+
+    def iter_keys(
+            self,
+            bucket: str,
+            prefix: str,
+            start_after: Optional[str] = None,
+            delimiter: Optional[str] = None,
+            with_metadata: bool = False,
+    ) -> Iterator[Union[str, dict]]:
+        """
+        Lazily iterate over the keys under a prefix, one page at a time
+        Args:
+            bucket:
+            prefix:
+            start_after: only keys after this one are returned, skipped server side.
+                Use the last processed key to resume a scan
+            delimiter: e.g. "/" to not descend into sub prefixes
+            with_metadata: yield the list_objects_v2 "Contents" entries instead of keys
+
+        Returns: iterator of keys or entries
+
+        """
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "PaginationConfig": {"PageSize": _LIST_PAGE_SIZE}}
+        if start_after is not None:
+            kwargs["StartAfter"] = start_after
+        if delimiter is not None:
+            kwargs["Delimiter"] = delimiter
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**kwargs):
+            for obj in page.get("Contents", []):
+                yield obj if with_metadata else obj["Key"]
+
+    def _list_exists(self, bucket: str, prefixes: Iterable[str]) -> Tuple[Dict[str, bool], List[str]]:
+        """
+        Resolve the existence of keys by listing, where listing is cheaper than head_object.
+        Keys are grouped by parent directory and each large enough group is checked with a
+        single level listing starting at its first key. A group stops listing after about
+        one page per key, so sparse keys in a big directory don't page through all of it
+        Args:
+            bucket:
+            prefixes:
+
+        Returns: mapping of resolved prefixes to whether they exist, and the prefixes that
+            still need a head_object check
+
+        """
+        groups = {}
+        for prefix in prefixes:
+            parent = prefix.rsplit("/", 1)[0] + "/" if "/" in prefix else ""
+            groups.setdefault(parent, []).append(prefix)
+
+        exists, unresolved = {}, []
+        for parent, group in groups.items():
+            if not parent or len(group) < _EXISTS_MANY_MIN_GROUP:
+                # listing is not worth it for a few keys, or the whole bucket root
+                unresolved.extend(group)
+                continue
+            group.sort()
+            last = group[-1]
+            max_keys = len(group) * _LIST_PAGE_SIZE
+            keys = set()
+            seen = None
+            # a proper prefix of the first key sorts before it, so that key itself is included
+            for key in self.iter_keys(bucket, parent, start_after=group[0][:-1], delimiter="/"):
+                if key > last:
+                    seen = last
+                    break
+                keys.add(key)
+                seen = key
+                if len(keys) >= max_keys:
+                    break
+            else:
+                seen = last
+            for p in group:
+                if seen is not None and p <= seen:
+                    exists[p] = p in keys
+                else:
+                    unresolved.append(p)
+        return exists, unresolved
+
+    def exists_many(self, bucket: str, prefixes: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check if many objects exist in s3, listing directories where that is cheaper and
+        issuing head_object requests in parallel for the rest
+        Args:
+            bucket:
+            prefixes:
+
+        Returns: mapping of prefix to whether it exists
+
+        """
+        exists, unresolved = self._list_exists(bucket, prefixes)
+        if unresolved:
+            with self._get_executor(ThreadPoolExecutor, min(len(unresolved), DEFAULT_MAX_WORKERS)) as ex:
+                found = ex.map(lambda p: self.check_exists(bucket, p, use_cache=False), unresolved)
+                exists.update(zip(unresolved, found))
+        return exists
+
     def get_s3_path(self, bucket: str, prefix: str):
         """
         get the s3 path
@@ -77,14 +385,17 @@ class S3Boto3:
         if prefix is None:
             prefix = os.path.basename(file_name)
 
-        if not overwrite and self.check_exists(bucket, prefix):
+        if not overwrite and self.check_exists(bucket, prefix, use_cache=False):
             logger.info(
                 f"[Upload] {self.get_s3_path(bucket, prefix)} exists -- skipping"
             )
             return True
 
         try:
-            response = self.s3_client.upload_file(file_name, bucket, prefix)
+            self.s3_client.upload_file(
+                file_name, bucket, prefix, Config=self._transfer_config
+            )
+            self._evict_header(bucket, prefix)
             logger.info(f"[Uploaded] {self.get_s3_path(bucket, prefix)}")
         except ClientError as e:
             logger.error(e)
@@ -114,7 +425,193 @@ class S3Boto3:
             target.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"[Downloading] {self.get_s3_path(bucket, prefix)} -> {target}")
-        self.s3_resource.Bucket(bucket).download_file(prefix, str(target))
+        self.s3_client.download_file(
+            bucket, prefix, str(target), Config=self._transfer_config
+        )
+
+    def _get_process_settings(self) -> bytes:
+        # pickled once so every task sends, and worker processes cache by, the same bytes
+        if self._process_settings is None:
+            self._process_settings = pickle.dumps(self._init_kwargs)
+        return self._process_settings
+
+    def _get_executor(self, executor_cls: Type[Executor], max_workers: int) -> Executor:
+        if issubclass(executor_cls, ProcessPoolExecutor):
+            # the client can't be pickled, so each worker process builds its own
+            return executor_cls(max_workers, mp_context=multiprocessing.get_context("spawn"))
+        if max_workers > self._max_pool_connections:
+            logger.warning(
+                f"max_workers={max_workers} exceeds max_pool_connections={self._max_pool_connections}, "
+                f"connections will be discarded and re-established"
+            )
+        return executor_cls(max_workers)
+
+    def download_many(
+            self,
+            items: Iterable[Tuple[str, str, str]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            overwrite: bool = False,
+            executor_cls: Type[Executor] = ThreadPoolExecutor,
+    ):
+        """
+        Download many files from s3 in parallel
+        Args:
+            items: iterable of (bucket, prefix, target) tuples
+            max_workers: number of threads or processes
+            overwrite:
+            executor_cls: ThreadPoolExecutor to share this client between threads, or
+                ProcessPoolExecutor to spread CPU bound work (TLS, checksums) over cores
+                with one client per process
+
+        Returns: None
+
+        """
+        items = list(items)
+        with self._get_executor(executor_cls, max_workers) as ex:
+            if issubclass(executor_cls, ProcessPoolExecutor):
+                worker = functools.partial(
+                    _worker_download, settings=self._get_process_settings(), overwrite=overwrite
+                )
+                list(ex.map(worker, *zip(*items)))
+            else:
+                list(ex.map(lambda t: self.download_file(*t, overwrite=overwrite), items))
+
+    def upload_many(
+            self,
+            items: Iterable[Tuple[str, str, str]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            overwrite: bool = False,
+            executor_cls: Type[Executor] = ThreadPoolExecutor,
+    ) -> List[bool]:
+        """
+        Upload many files to s3 in parallel
+        Args:
+            items: iterable of (file_name, bucket, prefix) tuples
+            max_workers: number of threads or processes
+            overwrite:
+            executor_cls: ThreadPoolExecutor to share this client between threads, or
+                ProcessPoolExecutor to spread CPU bound work (TLS, checksums) over cores
+                with one client per process
+
+        Returns: list of upload_file results in the order of items
+
+        """
+        items = [
+            (file_name, bucket, os.path.basename(file_name) if prefix is None else prefix)
+            for file_name, bucket, prefix in items
+        ]
+        # existence of keys resolved by listing, the others are checked by upload_file in the workers
+        exists = {}
+        if not overwrite:
+            by_bucket = {}
+            for _, bucket, prefix in items:
+                by_bucket.setdefault(bucket, []).append(prefix)
+            for bucket, prefixes in by_bucket.items():
+                listed, _ = self._list_exists(bucket, prefixes)
+                exists.update({(bucket, p): e for p, e in listed.items()})
+
+        results = [True] * len(items)
+        pending, pending_overwrite = [], []
+        for i, (file_name, bucket, prefix) in enumerate(items):
+            if exists.get((bucket, prefix)):
+                logger.info(
+                    f"[Upload] {self.get_s3_path(bucket, prefix)} exists -- skipping"
+                )
+            else:
+                pending.append(i)
+                pending_overwrite.append(overwrite or (bucket, prefix) in exists)
+
+        with self._get_executor(executor_cls, max_workers) as ex:
+            if issubclass(executor_cls, ProcessPoolExecutor):
+                worker = functools.partial(_worker_upload, settings=self._get_process_settings())
+                uploaded = ex.map(worker, *zip(*(items[i] for i in pending)), pending_overwrite)
+            else:
+                uploaded = ex.map(
+                    lambda i, o: self.upload_file(*items[i], overwrite=o), pending, pending_overwrite
+                )
+            for i, result in zip(pending, uploaded):
+                results[i] = result
+        if issubclass(executor_cls, ProcessPoolExecutor):
+            for i in pending:
+                self._evict_header(items[i][1], items[i][2])
+        return results
+
+    def copy(self, src_bucket: str, src_prefix: str, dst_bucket: str, dst_prefix: str):
+        """
+        Copy an object within s3 server side, without downloading it
+        Args:
+            src_bucket:
+            src_prefix:
+            dst_bucket:
+            dst_prefix:
+
+        Returns: None
+
+        """
+        logger.info(
+            f"[Copying] {self.get_s3_path(src_bucket, src_prefix)} -> {self.get_s3_path(dst_bucket, dst_prefix)}"
+        )
+        self.s3_client.copy(
+            CopySource={"Bucket": src_bucket, "Key": src_prefix},
+            Bucket=dst_bucket,
+            Key=dst_prefix,
+            Config=self._transfer_config,
+        )
+        self._evict_header(dst_bucket, dst_prefix)
+
+    def copy_many(self, pairs: Iterable[Tuple[str, str, str, str]], max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Copy many objects within s3 server side in parallel, sharing this client
+        Args:
+            pairs: iterable of (src_bucket, src_prefix, dst_bucket, dst_prefix) tuples
+            max_workers: number of threads
+
+        Returns: None
+
+        """
+        with self._get_executor(ThreadPoolExecutor, max_workers) as ex:
+            list(ex.map(lambda t: self.copy(*t), pairs))
+
+
+_process_clients: Dict[bytes, S3Boto3] = {}
+
+
+def _get_process_client(settings: bytes) -> S3Boto3:
+    """
+    Get the S3Boto3 of the current worker process for the pickled constructor
+    settings of the parent client, creating it on first use
+    """
+    if settings not in _process_clients:
+        _process_clients[settings] = S3Boto3(**pickle.loads(settings))
+    return _process_clients[settings]
+
+
+def _worker_download(
+        bucket: str, prefix: str, target: str, settings: bytes, overwrite: bool = False
+):
+    _get_process_client(settings).download_file(bucket, prefix, target, overwrite=overwrite)
+
+
+def _worker_upload(
+        file_name: str, bucket: str, prefix: str, overwrite: bool = False, *, settings: bytes
+) -> bool:
+    return _get_process_client(settings).upload_file(file_name, bucket, prefix, overwrite=overwrite)
+
+
+_default_client: Optional[S3Boto3] = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> S3Boto3:
+    """
+    Lazily create the S3Boto3 shared by all S3Objects that are not given a client
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = S3Boto3()
+    return _default_client
 
 
 class S3Object:
@@ -140,7 +637,8 @@ class S3Object:
             key: a key that represents the objects
             local_path: a specific local path to use. If None it is derived from prefix and base_dir
             base_dir: a base directory to use locally
-            s3_client: the s3 client
+            s3_client: the s3 client. If None a shared default client is used;
+                pass one explicitly to use a different endpoint or config
             **kwargs:
         """
         self.bucket = bucket
@@ -148,13 +646,22 @@ class S3Object:
         self.base_dir = base_dir
         self.key = key
         self._name = None
+        self._basename = None
         self._ext = None
         self._local_path = local_path
         self._header = None
-        self.s3_client = s3_client or S3Boto3()
+        self.s3_client = s3_client or _get_default_client()
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(name={self.name}, s3_path={self.s3_path}, local_path={self.local_path})"
+        return f"{type(self).__name__}(bucket={self.bucket!r}, prefix={self.prefix!r})"
+
+    def describe(self) -> str:
+        """
+
+        Returns: a description including name, s3 path and local path
+
+        """
+        return f"{type(self).__name__}(name={self.name}, s3_path={self.s3_path}, local_path={self.local_path})"
 
     @classmethod
     def from_s3_path(
@@ -165,9 +672,8 @@ class S3Object:
             local_path: Optional[str] = None,
             **kwargs,
     ):
-        path_parts = s3_path.replace("s3://", "").split("/")
-        bucket = path_parts.pop(0)
-        prefix = "/".join(path_parts)
+        rest = s3_path[5:] if s3_path.startswith("s3://") else s3_path
+        bucket, _, prefix = rest.partition("/")
         return cls(
             bucket=bucket,
             prefix=prefix,
@@ -180,9 +686,54 @@ class S3Object:
     @property
     def header(self):
         if self._header is None:
-            self._header = self.s3_client.get_header(self.bucket, self.prefix)
+            self._header = self.s3_client.get_header(self.bucket, self.prefix, use_cache=True)
         return self._header
 
+    @classmethod
+    def prefetch_headers(
+            cls,
+            bucket: str,
+            parent_prefix: str,
+            s3_client: Optional[S3Boto3] = None,
+    ) -> int:
+        """
+        List a parent prefix once and cache the headers of all objects under it on the
+        client, so header and exists_remote of those objects don't need a head_object request each
+        Args:
+            bucket: s3 bucket
+            parent_prefix: directory-like prefix to list
+            s3_client: the s3 client whose cache is filled. If None the shared default client is used
+
+        Returns: number of objects listed
+
+        """
+        s3_client = s3_client or _get_default_client()
+        return s3_client.prefetch_headers(bucket, parent_prefix)
+
+    @classmethod
+    def from_list_entry(
+            cls,
+            bucket: str,
+            list_obj: dict,
+            base_dir: str = "/tmp",
+            **kwargs,
+    ):
+        """
+        Create an object from an entry of a list_objects_v2 response, reusing its
+        metadata as header so no head_object request is needed
+        Args:
+            bucket: s3 bucket
+            list_obj: an entry of the "Contents" of a list_objects_v2 response
+            base_dir: a base directory to use locally
+            **kwargs:
+
+        Returns: S3Object
+
+        """
+        obj = cls(bucket=bucket, prefix=list_obj["Key"], base_dir=base_dir, **kwargs)
+        obj._header = _header_from_list_entry(list_obj)
+        return obj
+
     @classmethod
     def from_local_path(
             cls,
@@ -191,11 +742,14 @@ class S3Object:
             key: Optional[str] = None,
             **kwargs,
     ):
-        if base_dir not in local_path:
-            raise Exception(f"base_dir {base_dir} not part of {local_path}")
+        abs_local_path = os.path.abspath(local_path)
+        abs_base_dir = os.path.abspath(base_dir)
+        if os.path.commonpath([abs_local_path, abs_base_dir]) != abs_base_dir:
+            raise ValueError(f"base_dir {base_dir} not part of {local_path}")
         return cls(
             bucket=kwargs.pop("bucket") if "bucket" in kwargs else "local",
-            prefix=kwargs.pop("prefix") if "prefix" in kwargs else str(Path(local_path).relative_to(base_dir)),
+            prefix=kwargs.pop("prefix") if "prefix" in kwargs else
+            os.path.relpath(abs_local_path, abs_base_dir).replace(os.sep, "/"),
             base_dir=base_dir,
             key=key,
             local_path=local_path,
@@ -207,7 +761,10 @@ class S3Object:
         """
         use provided local path; otherwise, use from prefix
         """
-        return self._local_path or str(Path(f"{self.base_dir}/{self.prefix}"))
+        if self._local_path is None:
+            # s3 keys always use "/" so there is no need to go through Path
+            self._local_path = f"{self.base_dir.rstrip('/')}/{self.prefix.rstrip('/')}"
+        return self._local_path
 
     @property
     def s3_path(self) -> str:
@@ -226,7 +783,7 @@ class S3Object:
 
         """
         if self._ext is None:
-            self._ext = get_extension(self.prefix)
+            self._ext = _fast_ext(self.prefix)
 
         return self._ext
 
@@ -238,8 +795,8 @@ class S3Object:
 
         """
         if self._name is None:
-            path = Path(self.prefix)
-            self._name = path.name.replace(self.extension, "")
+            basename, ext = self.basename, self.extension
+            self._name = basename[:-len(ext)] if ext else basename
         return self._name
 
     @property
@@ -249,7 +806,10 @@ class S3Object:
         Returns: basename from prefix
 
         """
-        return Path(self.prefix).name
+        if self._basename is None:
+            # like Path (and extension), ignore the trailing "/" of folder markers
+            self._basename = self.prefix.rstrip("/").rsplit("/", 1)[-1]
+        return self._basename
 
     def download(self, overwrite: bool = False):
         """
@@ -265,6 +825,20 @@ class S3Object:
                                      prefix=self.prefix,
                                      target=self.local_path, overwrite=overwrite)
 
+    async def download_async(self, aio_client, overwrite: bool = False):
+        """
+        Download an object from s3 using an async client
+        Args:
+            aio_client: an entered s3obj.aio.AsyncS3Boto3
+            overwrite: Whether to overwrite if it already exists
+
+        Returns: None
+
+        """
+        await aio_client.download_file(bucket=self.bucket,
+                                       prefix=self.prefix,
+                                       target=self.local_path, overwrite=overwrite)
+
     def upload(self, overwrite: bool = False) -> None:
         """
         Upload an object to s3
@@ -276,6 +850,91 @@ class S3Object:
         """
         self.s3_client.upload_file(file_name=self.local_path, bucket=self.bucket, prefix=self.prefix,
                                    overwrite=overwrite)
+        self._header = None
+
+    @classmethod
+    def download_many(
+            cls,
+            objs: Iterable["S3Object"],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            overwrite: bool = False,
+            s3_client: Optional[S3Boto3] = None,
+            executor_cls: Type[Executor] = ThreadPoolExecutor,
+    ) -> None:
+        """
+        Download many objects from s3 in parallel
+        Args:
+            objs: objects to download
+            max_workers: number of threads or processes
+            overwrite: Whether to overwrite if it already exists
+            s3_client: the s3 client to use for all objects. If None each object uses its own client
+            executor_cls: ThreadPoolExecutor or ProcessPoolExecutor, see S3Boto3.download_many
+
+        Returns: None
+
+        """
+        for client, group in cls._group_by_client(objs, s3_client):
+            client.download_many(
+                [(obj.bucket, obj.prefix, obj.local_path) for _, obj in group],
+                max_workers=max_workers,
+                overwrite=overwrite,
+                executor_cls=executor_cls,
+            )
+
+    @classmethod
+    def upload_many(
+            cls,
+            objs: Iterable["S3Object"],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            overwrite: bool = False,
+            s3_client: Optional[S3Boto3] = None,
+            executor_cls: Type[Executor] = ThreadPoolExecutor,
+    ) -> List[bool]:
+        """
+        Upload many objects to s3 in parallel
+        Args:
+            objs: objects to upload
+            max_workers: number of threads or processes
+            overwrite: Whether to overwrite if it already exists
+            s3_client: the s3 client to use for all objects. If None each object uses its own client
+            executor_cls: ThreadPoolExecutor or ProcessPoolExecutor, see S3Boto3.download_many
+
+        Returns: list of upload results in the order of objs
+
+        """
+        objs = list(objs)
+        results = [True] * len(objs)
+        for client, group in cls._group_by_client(objs, s3_client):
+            uploaded = client.upload_many(
+                [(obj.local_path, obj.bucket, obj.prefix) for _, obj in group],
+                max_workers=max_workers,
+                overwrite=overwrite,
+                executor_cls=executor_cls,
+            )
+            for (i, obj), result in zip(group, uploaded):
+                results[i] = result
+                # the object may have changed on s3, like in upload
+                obj._header = None
+        return results
+
+    @staticmethod
+    def _group_by_client(
+            objs: Iterable["S3Object"], s3_client: Optional[S3Boto3] = None
+    ) -> List[Tuple[S3Boto3, List[Tuple[int, "S3Object"]]]]:
+        """
+        Group objects with their index by the client to use for them
+        Args:
+            objs: objects to group
+            s3_client: if given it is used for all objects
+
+        Returns: list of (client, [(index, object)]) in order of first appearance
+
+        """
+        groups = {}
+        for i, obj in enumerate(objs):
+            client = s3_client or obj.s3_client
+            groups.setdefault(id(client), (client, []))[1].append((i, obj))
+        return list(groups.values())
 
     def exists_local(self):
         """
@@ -283,7 +942,39 @@ class S3Object:
         Returns: True if exists
 
         """
-        return os.path.exists(self.local_path)
+        return os.path.isfile(self.local_path)
+
+    @staticmethod
+    def exists_local_many(objs: Iterable["S3Object"]) -> List[bool]:
+        """
+        Check if many objects exist locally. Directories holding many of the objects are
+        scanned once instead of calling stat for every object; objects in directories with
+        only a few of them are checked with os.path.isfile, as scanning a large directory
+        for them would be slower
+        Args:
+            objs: objects to check
+
+        Returns: list of whether each object exists, in the order of objs
+
+        """
+        paths = [obj.local_path for obj in objs]
+        groups = {}
+        for path in paths:
+            groups.setdefault(os.path.dirname(path), []).append(path)
+
+        exists = {}
+        for parent, group in groups.items():
+            if len(group) < _EXISTS_LOCAL_MANY_MIN_GROUP:
+                exists.update({path: os.path.isfile(path) for path in group})
+                continue
+            try:
+                with os.scandir(parent or ".") as it:
+                    files = {entry.name for entry in it if entry.is_file()}
+            except OSError:
+                # missing or unreadable directory, like os.path.isfile in exists_local
+                files = set()
+            exists.update({path: os.path.basename(path) in files for path in group})
+        return [exists[path] for path in paths]
 
     def exists_remote(self):
         """
@@ -291,8 +982,29 @@ class S3Object:
         Returns: True if exists
 
         """
+        if self._header is not None:
+            return True
         return self.s3_client.check_exists(self.bucket, self.prefix)
 
+    def copy_to(self, dst_bucket: str, dst_prefix: str) -> "S3Object":
+        """
+        Copy the object to another location on s3 server side
+        Args:
+            dst_bucket: destination s3 bucket
+            dst_prefix: destination s3 prefix
+
+        Returns: the S3Object of the copy
+
+        """
+        self.s3_client.copy(self.bucket, self.prefix, dst_bucket, dst_prefix)
+        return self.__class__(
+            bucket=dst_bucket,
+            prefix=dst_prefix,
+            base_dir=self.base_dir,
+            key=self.key,
+            s3_client=self.s3_client,
+        )
+
     def delete(self):
         """
         Delete an object locally
@@ -1,5 +1,13 @@
-from pathlib import Path
+def _fast_ext(path: str) -> str:
+    # same result as "".join(Path(path).suffixes) for s3 keys, using only string operations.
+    # Like Path, trailing "/" are ignored; "." and ".." path components are not collapsed
+    path = path.rstrip("/")
+    name = path[path.rfind("/") + 1:]
+    if name.endswith("."):
+        return ""
+    i = name.find(".", len(name) - len(name.lstrip(".")))
+    return name[i:] if i >= 0 else ""
 
 
 def get_extension(path: str):
-    return "".join(Path(path).suffixes)
\ No newline at end of file
+    return _fast_ext(path)
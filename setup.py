@@ -25,5 +25,6 @@ setup(
     classifiers=[
         "Programming Language :: Python :: 3.7",
     ],
-    install_requires=requirements
+    install_requires=requirements,
+    extras_require={"aio": ["aioboto3"]},
 )